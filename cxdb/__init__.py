@@ -1,20 +1,30 @@
-from .core import CXDB
-from .cypher import CypherExecutor
-from .ndex import NDExConnector
-
 __version__ = "0.1.0"
 
 # Optional: define what gets imported with `from cxdb import *`
 __all__ = ['CXDB', 'CypherExecutor', 'NDExConnector']
 
-# Optional: any initialization code the package needs
-def initialize():
-    # Perform any necessary setup
-    pass
+# Submodules are imported on first attribute access (PEP 562), so `import cxdb`
+# does not pull in pandas or ndex2 until they are actually needed
+_LAZY_ATTRS = {
+    'CXDB': '.core',
+    'CypherExecutor': '.cypher',
+    'NDExConnector': '.ndex',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-initialize()
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # convenience function
 def create_cxdb_instance():
     """Create and return a new CXDB instance."""
-    return CXDB()
\ No newline at end of file
+    from .core import CXDB
+    return CXDB()
@@ -2,117 +2,393 @@
 
 import pandas as pd
 
+NODE_COLUMNS = ['id', 'name', 'type', 'properties']
+EDGE_COLUMNS = ['source_id', 'target_id', 'relationship', 'properties']
+# Column dtypes for the DataFrame views: integer ids, dictionary-encoded labels
+NODE_DTYPES = {'id': 'int64', 'type': 'category'}
+EDGE_DTYPES = {'source_id': 'int64', 'target_id': 'int64', 'relationship': 'category'}
+# Columns the DataFrame views are indexed by, so `nodes.loc[id]` / `edges.loc[key]` are hash lookups
+NODE_KEY = ['id']
+EDGE_KEY = ['source_id', 'target_id', 'relationship']
+
+def _build_frame(records, columns, dtypes, key):
+    # Indexed before casting, so key levels stay plain like those of appended rows
+    return _index_by_key(pd.DataFrame.from_records(records, columns=columns), key).astype(dtypes)
+
+def _append_frame(frame, records, columns, dtypes, key):
+    new_rows = pd.DataFrame.from_records(records, columns=columns)
+    # Only the appended rows are cast. Existing categorical columns gain any new categories
+    # without re-encoding their codes, so both sides share one dtype and concat keeps it.
+    extended = {}
+    for column, dtype in dtypes.items():
+        if dtype == 'category':
+            current = frame[column].cat
+            added = pd.Index(new_rows[column].dropna().unique()).difference(current.categories)
+            if len(added):
+                extended[column] = current.add_categories(added)
+            categories = extended[column].cat.categories if column in extended else current.categories
+            new_rows[column] = pd.Categorical(new_rows[column], categories=categories)
+        else:
+            new_rows[column] = new_rows[column].astype(dtype)
+    if extended:
+        frame = frame.assign(**extended)
+    return pd.concat([frame, _index_by_key(new_rows, key)])
+
+def _index_by_key(frame, key):
+    frame = frame.set_index(key, drop=False)
+    # Leave the index unnamed so the key columns remain unambiguous column references
+    frame.index.names = [None] * frame.index.nlevels
+    return frame
+
 class CXDB:
     def __init__(self):
-        self.nodes = pd.DataFrame(columns=['id', 'name', 'type', 'properties'])
-        self.edges = pd.DataFrame(columns=['source_id', 'target_id', 'relationship', 'properties'])
+        # Primary storage: node id -> node record, (source, target, relationship) -> edge record.
+        # The `nodes` / `edges` DataFrames are views built from these on demand.
+        self._nodes = {}
+        self._edges = {}
+        # Adjacency indexes: source -> {(target, relationship): edge}, target -> {(source, relationship)}
+        self._fwd = {}
+        self._bwd = {}
+        self._nodes_df = None
+        self._edges_df = None
+        # Records added since the views were last built, appended to them on next access
+        self._pending_nodes = []
+        self._pending_edges = []
+        # Property columns extracted from the nodes view, keyed by property name
+        self._node_columns = {}
+        self._name_to_id = {}
+        # Label index: node type -> ids of the nodes with that type
+        self._type_to_ids = {}
         self.next_node_id = 1
-        self.node_names = set()
+
+    @property
+    def node_names(self):
+        """
+        Read-only view of the node names currently in use.
+        """
+        return self._name_to_id.keys()
+
+    @property
+    def nodes(self):
+        """
+        DataFrame view of the nodes, indexed by node id, materialized lazily and cached.
+        Newly added nodes are appended to the cached frame, deletions filter it and updates
+        rebuild it.
+        """
+        if self._nodes_df is None or self._nodes_df.empty:
+            self._nodes_df = _build_frame(list(self._nodes.values()), NODE_COLUMNS, NODE_DTYPES, NODE_KEY)
+            self._node_columns.clear()
+        elif self._pending_nodes:
+            self._nodes_df = _append_frame(self._nodes_df, self._pending_nodes, NODE_COLUMNS, NODE_DTYPES,
+                                          NODE_KEY)
+            self._extend_node_columns(self._pending_nodes, self._nodes_df.index[-len(self._pending_nodes):])
+        self._pending_nodes.clear()
+        return self._nodes_df
+
+    def node_property(self, key):
+        """
+        Column of node property `key`, aligned with the `nodes` view, with NA where a node
+        lacks the property. Columns are extracted on first use with an inferred dtype and
+        cached; appends and deletions keep them aligned with the view, updates drop them.
+        Repeated filters on the same key therefore skip the per-row dict lookups.
+        """
+        nodes = self.nodes
+        column = self._node_columns.get(key)
+        if column is None:
+            get = dict.get
+            values = [get(properties, key) for properties in nodes['properties'].to_numpy()]
+            column = pd.Series(pd.array(values) if values else pd.array([], dtype=object), index=nodes.index)
+            self._node_columns[key] = column
+        return column
+
+    def _extend_node_columns(self, records, index):
+        """
+        Append the values of newly added nodes to the cached property columns. A column
+        whose dtype the new values do not fit is dropped and re-extracted on next use.
+        """
+        get = dict.get
+        columns = self._node_columns
+        for key, column in list(columns.items()):
+            values = [get(record['properties'], key) for record in records]
+            inferred = pd.array(values)
+            if inferred.dtype == column.dtype:
+                new_values = inferred
+            elif all(value is None for value in values):
+                new_values = pd.array(values, dtype=column.dtype)
+            else:
+                del columns[key]
+                continue
+            columns[key] = pd.concat([column, pd.Series(new_values, index=index)])
+
+    @property
+    def edges(self):
+        """
+        DataFrame view of the edges, indexed by (source_id, target_id, relationship), materialized lazily and cached.
+        Newly added edges are appended to the cached frame, deletions filter it and updates
+        rebuild it.
+        """
+        if self._edges_df is None or self._edges_df.empty:
+            self._edges_df = _build_frame(list(self._edges.values()), EDGE_COLUMNS, EDGE_DTYPES, EDGE_KEY)
+        elif self._pending_edges:
+            self._edges_df = _append_frame(self._edges_df, self._pending_edges, EDGE_COLUMNS, EDGE_DTYPES,
+                                          EDGE_KEY)
+        self._pending_edges.clear()
+        return self._edges_df
+
+    def node_ids_by_type(self, type):
+        """
+        Ids of the nodes with the given type, looked up in the label index.
+        """
+        return list(self._type_to_ids.get(type, ()))
+
+    def _invalidate_nodes(self):
+        self._nodes_df = None
+        self._pending_nodes.clear()
+        self._node_columns.clear()
+
+    def _invalidate_edges(self):
+        self._edges_df = None
+        self._pending_edges.clear()
 
     def add_node(self, name, type, properties=None):
-        if name in self.node_names:
+        if name in self._name_to_id:
             raise ValueError("Node name must be unique")
-        if properties is None:
-            properties = {}
+        # Stored properties are private copies, so edits to the caller's dict cannot
+        # bypass the cached property columns
+        properties = {} if properties is None else dict(properties)
         node_id = int(self.next_node_id)
         self.next_node_id += 1
-        new_node = pd.DataFrame([[node_id, name, type, properties]], columns=self.nodes.columns)
-        self.nodes = pd.concat([self.nodes, new_node], ignore_index=True)
-        self.node_names.add(name)
+        node = {'id': node_id, 'name': name, 'type': type, 'properties': properties}
+        self._nodes[node_id] = node
+        if self._nodes_df is not None:
+            self._pending_nodes.append(node)
+        self._name_to_id[name] = node_id
+        self._type_to_ids.setdefault(type, set()).add(node_id)
         return node_id
 
+    def add_nodes(self, records):
+        """
+        Add many nodes in one call.
+
+        Args:
+        records (Iterable[dict]): Node records with a 'name', a 'type' and optional 'properties'.
+
+        Returns:
+        list[int]: The ids assigned to the new nodes, in input order.
+        """
+        records = list(records)
+        names = [record['name'] for record in records]
+        if len(set(names)) != len(names) or not self._name_to_id.keys().isdisjoint(names):
+            raise ValueError("Node name must be unique")
+
+        node_ids = list(range(self.next_node_id, self.next_node_id + len(records)))
+        self.next_node_id += len(records)
+        nodes = self._nodes
+        type_to_ids = self._type_to_ids
+        new_nodes = []
+        append = new_nodes.append
+        for node_id, record in zip(node_ids, records):
+            properties = record.get('properties')
+            node = {
+                'id': node_id,
+                'name': record['name'],
+                'type': record['type'],
+                'properties': {} if properties is None else dict(properties),
+            }
+            nodes[node_id] = node
+            type_to_ids.setdefault(node['type'], set()).add(node_id)
+            append(node)
+        self._name_to_id.update(zip(names, node_ids))
+        if self._nodes_df is not None:
+            self._pending_nodes.extend(new_nodes)
+        return node_ids
+
     def get_node(self, node_id):
-        node = self.nodes[self.nodes['id'] == node_id]
-        if node.empty:
+        node = self._nodes.get(node_id)
+        if node is None:
             return None
-        return node.iloc[0].to_dict()
+        node = dict(node)
+        node['properties'] = dict(node['properties'])
+        return node
+
+    def get_node_by_name(self, name):
+        node_id = self._name_to_id.get(name)
+        if node_id is None:
+            return None
+        return self.get_node(node_id)
 
     def add_edge(self, source_id, target_id, relationship, properties=None):
-        if properties is None:
-            properties = {}
-        new_edge = pd.DataFrame([[int(source_id), int(target_id), relationship, properties]], 
-                                columns=self.edges.columns)
-        self.edges = pd.concat([self.edges, new_edge], ignore_index=True)
+        """
+        Add an edge, keyed by (source_id, target_id, relationship).
+
+        Edges are unique per key: adding an edge whose key already exists replaces that
+        edge and its properties rather than storing a parallel duplicate.
+        """
+        self._insert_edge(source_id, target_id, relationship, properties)
+
+    def add_edges(self, records):
+        """
+        Add many edges in one call.
+
+        Args:
+        records (Iterable[dict]): Edge records with 'source_id', 'target_id', 'relationship'
+            and optional 'properties'.
+        """
+        insert_edge = self._insert_edge
+        for record in records:
+            insert_edge(record['source_id'], record['target_id'], record['relationship'],
+                        record.get('properties'))
+
+    def _insert_edge(self, source_id, target_id, relationship, properties):
+        # Stored properties are private copies, as for nodes
+        properties = {} if properties is None else dict(properties)
+        source_id, target_id = int(source_id), int(target_id)
+        edge = {
+            'source_id': source_id,
+            'target_id': target_id,
+            'relationship': relationship,
+            'properties': properties,
+        }
+        key = (source_id, target_id, relationship)
+        if key in self._edges:
+            # Replacing an edge changes an existing row, so the view has to be rebuilt
+            self._invalidate_edges()
+        elif self._edges_df is not None:
+            self._pending_edges.append(edge)
+        self._edges[key] = edge
+        self._fwd.setdefault(source_id, {})[(target_id, relationship)] = edge
+        self._bwd.setdefault(target_id, set()).add((source_id, relationship))
 
     def get_edge(self, source_id, target_id, relationship):
-        edge = self.edges[(self.edges['source_id'] == source_id) & 
-                          (self.edges['target_id'] == target_id) & 
-                          (self.edges['relationship'] == relationship)]
-        if edge.empty:
+        edge = self._fwd.get(source_id, {}).get((target_id, relationship))
+        if edge is None:
             return None
-        return edge.iloc[0].to_dict()
+        edge = dict(edge)
+        edge['properties'] = dict(edge['properties'])
+        return edge
 
     def update_node(self, node_id, name=None, type=None, properties=None):
-        node_index = self.nodes[self.nodes['id'] == node_id].index
-        
-        if node_index.empty:
+        node = self._nodes.get(node_id)
+
+        if node is None:
             raise ValueError("Node not found")
-        
+
         if name:
-            if name in self.node_names:
+            if name in self._name_to_id:
                 raise ValueError("Node name must be unique")
-            old_name = self.nodes.at[node_index[0], 'name']
-            self.node_names.remove(old_name)
-            self.nodes.at[node_index[0], 'name'] = name
-            self.node_names.add(name)
-        
+            del self._name_to_id[node['name']]
+            node['name'] = name
+            self._name_to_id[name] = node_id
+
         if type:
-            self.nodes.at[node_index[0], 'type'] = type
-        
+            self._discard_type(node['type'], node_id)
+            node['type'] = type
+            self._type_to_ids.setdefault(type, set()).add(node_id)
+
         if properties:
-            current_properties = self.nodes.at[node_index[0], 'properties']
+            current_properties = node['properties']
             for key, value in properties.items():
                 if value is None:
                     current_properties.pop(key, None)
                 else:
                     current_properties[key] = value
-            self.nodes.at[node_index[0], 'properties'] = current_properties
-        
+
+        self._invalidate_nodes()
         return node_id
 
     def update_edge(self, source_id, target_id, relationship, properties=None):
-        edge_index = self.edges[(self.edges['source_id'] == source_id) & 
-                                (self.edges['target_id'] == target_id) & 
-                                (self.edges['relationship'] == relationship)].index
-        
-        if edge_index.empty:
+        edge = self._fwd.get(source_id, {}).get((target_id, relationship))
+
+        if edge is None:
             raise ValueError("Edge not found")
 
         if properties:
-            current_properties = self.edges.at[edge_index[0], 'properties']
+            current_properties = edge['properties']
             for key, value in properties.items():
                 if value is None:
                     current_properties.pop(key, None)
                 else:
                     current_properties[key] = value
-            self.edges.at[edge_index[0], 'properties'] = current_properties
+            self._invalidate_edges()
 
     def delete_node(self, node_id):
-        node = self.nodes[self.nodes['id'] == node_id]
-        if node.empty:
+        self.delete_nodes([node_id])
+
+    def delete_nodes(self, node_ids):
+        """
+        Delete several nodes and their incident edges in one pass.
+
+        Args:
+        node_ids (Iterable[int]): Ids of the nodes to delete. All of them must exist.
+        """
+        node_ids = set(node_ids)
+        if not node_ids <= self._nodes.keys():
             raise ValueError("Node not found")
-        
-        node_name = node.iloc[0]['name']
-        self.node_names.remove(node_name)
-        self.nodes = self.nodes[self.nodes['id'] != node_id]
-        self.edges = self.edges[(self.edges['source_id'] != node_id) & (self.edges['target_id'] != node_id)]
+
+        nodes, name_to_id, fwd, bwd = self._nodes, self._name_to_id, self._fwd, self._bwd
+        delete_edge_raw = self._delete_edge_raw
+        edges_removed = False
+        for node_id in node_ids:
+            node = nodes.pop(node_id)
+            del name_to_id[node['name']]
+            self._discard_type(node['type'], node_id)
+            for target_id, relationship in list(fwd.get(node_id, ())):
+                delete_edge_raw(node_id, target_id, relationship)
+                edges_removed = True
+            for source_id, relationship in list(bwd.get(node_id, ())):
+                delete_edge_raw(source_id, node_id, relationship)
+                edges_removed = True
+
+        # Filter the cached views once rather than rebuilding them from the records
+        if self._nodes_df is not None and not self._pending_nodes:
+            keep = ~self._nodes_df['id'].isin(node_ids)
+            self._nodes_df = self._nodes_df[keep]
+            columns = self._node_columns
+            for key, column in columns.items():
+                columns[key] = column[keep]
+        else:
+            self._invalidate_nodes()
+        if edges_removed:
+            if self._edges_df is not None and not self._pending_edges:
+                edges = self._edges_df
+                keep = ~(edges['source_id'].isin(node_ids) | edges['target_id'].isin(node_ids))
+                self._edges_df = edges[keep]
+            else:
+                self._invalidate_edges()
+
+    def _discard_type(self, type, node_id):
+        ids = self._type_to_ids[type]
+        ids.discard(node_id)
+        if not ids:
+            del self._type_to_ids[type]
 
     def delete_edge(self, source_id, target_id, relationship):
-        edge = self.edges[(self.edges['source_id'] == source_id) & 
-                          (self.edges['target_id'] == target_id) & 
-                          (self.edges['relationship'] == relationship)]
-        if edge.empty:
+        if (source_id, target_id, relationship) not in self._edges:
             raise ValueError("Edge not found")
-        
-        self.edges = self.edges[~((self.edges['source_id'] == source_id) & 
-                                  (self.edges['target_id'] == target_id) & 
-                                  (self.edges['relationship'] == relationship))]
-        
+        self._delete_edge_raw(source_id, target_id, relationship)
+        self._invalidate_edges()
+
+    def _delete_edge_raw(self, source_id, target_id, relationship):
+        del self._edges[(source_id, target_id, relationship)]
+        outgoing = self._fwd[source_id]
+        del outgoing[(target_id, relationship)]
+        if not outgoing:
+            del self._fwd[source_id]
+        incoming = self._bwd[target_id]
+        incoming.discard((source_id, relationship))
+        if not incoming:
+            del self._bwd[target_id]
+
     def clear(self):
         """
         Clear all data from the CXDB instance, resetting it to its initial state.
         """
-        self.nodes = pd.DataFrame(columns=['id', 'name', 'type', 'properties'])
-        self.edges = pd.DataFrame(columns=['source_id', 'target_id', 'relationship', 'properties'])
+        self._nodes = {}
+        self._edges = {}
+        self._fwd = {}
+        self._bwd = {}
+        self._invalidate_nodes()
+        self._invalidate_edges()
+        self._name_to_id = {}
+        self._type_to_ids = {}
         self.next_node_id = 1
-        self.node_names.clear()
\ No newline at end of file
@@ -1,105 +1,323 @@
 # cxdb/cypher.py
 # https://neo4j.com/docs/cypher-manual/current/queries/expressions/
 
+import functools
+import itertools
+import operator
 import re
+from collections.abc import Iterator
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+# Query shapes, compiled once at import
+_OPERATION_RE = re.compile(r'(?P<op>MATCH|CREATE|DELETE)\b\s*', re.I)
+# `(n)` or `(n:Label)`; a label restricts the scan to that type's nodes via the label index
+_MATCH_RE = re.compile(r'\(n(?::(\w+))?\)\s+WHERE\s+(.+?)\s+RETURN\s+(.+?)\s*$')
+# One `n` or `n.prop` return item with an optional alias
+_RETURN_ITEM_RE = re.compile(r'\s*n(?:\.(\w+))?(?:\s+AS\s+(\w+))?\s*$')
+_CREATE_RE = re.compile(r'\(n:(\w+)\s*\{(.+?)\}\)')
+_DELETE_RE = re.compile(r'\(n(?::(\w+))?\)\s+WHERE\s+(.+)')
+# One `n.prop <op> value` condition plus its trailing AND; quoted values may contain AND
+_CONDITION_RE = re.compile(
+    r'\s*n\.(\w+)\s*(<>|<=|>=|=|<|>|CONTAINS\b)\s*(\'[^\']*\'|"[^"]*"|.+?)\s*(?:AND\s+|$)')
+# Numeric literals, so values are coerced without raising and catching ValueError
+_INT_RE = re.compile(r'[-+]?\d+')
+_FLOAT_RE = re.compile(r'[-+]?(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][-+]?\d+)?')
+# Ordering comparisons, applied to a whole property column at once
+_ORDERING_OPS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+
+def _compare_scalar(compare, left, right):
+    """
+    Compare one value against a literal; values of a different kind (string vs number) or
+    missing values never match.
+    """
+    if isinstance(left, str) != isinstance(right, str):
+        return False
+    try:
+        return bool(compare(left, right))
+    except TypeError:
+        return False
 
 class CypherExecutor:
-    def __init__(self, cxdb):
+    def __init__(self, cxdb, plan_cache_size=1024):
         self.cxdb = cxdb
+        # Parsed plans keyed by query string, so repeated queries skip dispatch and parsing
+        self._compile = functools.lru_cache(maxsize=plan_cache_size)(self._compile_query)
+
+    def execute(self, query, materialize=True):
+        """
+        Run a query. MATCH results are produced lazily; with materialize=False they are
+        returned as an iterator of row dicts instead of a list.
+        """
+        handler, args = self._compile(query.strip())
+        result = handler(*args)
+        if materialize and isinstance(result, Iterator):
+            return list(result)
+        return result
 
-    def execute(self, query):
-        parts = query.strip().split(maxsplit=1)
-        operation = parts[0].upper()
+    def _compile_query(self, query):
+        """
+        Parse a query into a (handler, arguments) plan.
+        """
+        match = _OPERATION_RE.match(query)
+        if not match:
+            operation = query.split(maxsplit=1)[0].upper() if query else query
+            raise ValueError(f"Unsupported operation: {operation}")
+
+        operation = match.group('op').upper()
+        rest = query[match.end():]
 
         if operation == 'MATCH':
-            return self._execute_match(parts[1])
+            return self._execute_match, self._parse_match(rest)
         elif operation == 'CREATE':
-            return self._execute_create(parts[1])
-        elif operation == 'DELETE':
-            return self._execute_delete(parts[1])
+            return self._execute_create, self._parse_create(rest)
         else:
-            raise ValueError(f"Unsupported operation: {operation}")
+            return self._execute_delete, self._parse_delete(rest)
 
-    def _execute_match(self, query):
-        match = re.match(r'\(n\)\s+WHERE\s+(.+?)\s+RETURN\s+n', query)
+    def _parse_match(self, query):
+        match = _MATCH_RE.match(query)
         if not match:
             raise ValueError("Unsupported MATCH query format")
 
-        where_clause = match.group(1)
-        conditions = self._parse_where_clause(where_clause)
+        label, where_clause, return_clause = match.groups()
+        return label, self._parse_where_clause(where_clause), self._parse_return_clause(return_clause)
 
-        matching_nodes = [
-            node for _, node in self.cxdb.nodes.iterrows() 
-            if all(self._evaluate_condition(node['properties'], cond) for cond in conditions)
-        ]
-        return matching_nodes
+    def _parse_return_clause(self, return_clause):
+        """
+        Split the RETURN items into (property, alias) pairs once per plan; property is None
+        for a bare `n`. Returns None for the plain `RETURN n` case.
+        """
+        items = []
+        for item in return_clause.split(','):
+            match = _RETURN_ITEM_RE.match(item)
+            if not match:
+                raise ValueError(f"Invalid item in RETURN clause: {item.strip()}")
+            property_name, alias = match.groups()
+            if alias is None:
+                alias = 'n' if property_name is None else f"n.{property_name}"
+            items.append((property_name, alias))
+        if items == [(None, 'n')]:
+            return None
+        return tuple(items)
 
-    def _execute_create(self, query):
-        match = re.match(r'\(n:(\w+)\s*\{(.+?)\}\)', query)
+    def _parse_create(self, query):
+        match = _CREATE_RE.match(query)
         if not match:
             raise ValueError("Unsupported CREATE query format")
 
         label, properties_str = match.groups()
-        properties = self._parse_properties(properties_str)
-
-        node_id = self.cxdb.add_node(f"Node_{self.cxdb.next_node_id}", label, properties)
-        return node_id
+        return label, self._parse_properties(properties_str)
 
-    def _execute_delete(self, query):
-        match = re.match(r'\(n\)\s+WHERE\s+(.+)', query)
+    def _parse_delete(self, query):
+        match = _DELETE_RE.match(query)
         if not match:
             raise ValueError("Unsupported DELETE query format")
+        label, where_clause = match.groups()
+        return label, self._parse_where_clause(where_clause)
+
+    def _execute_match(self, label, conditions, return_items):
+        nodes = self.cxdb.nodes
+        mask = self._conditions_mask(nodes, conditions, label)
+        return self._iter_rows(nodes[mask], return_items)
 
-        where_clause = match.group(1)
-        conditions = self._parse_where_clause(where_clause)
+    def _iter_rows(self, nodes, return_items):
+        """
+        Yield one result dict per matched node. Each returned column is pulled out of the
+        frame once and the columns are zipped lazily, so rows are built only as consumed.
+        """
+        if return_items is None:
+            keys = nodes.columns.tolist()
+            # Rows get copies of the stored properties dicts; editing a result must not
+            # change the data behind the cached property columns
+            columns = [map(dict, nodes[key].to_numpy()) if key == 'properties' else nodes[key].tolist()
+                       for key in keys]
+            for row in zip(*columns):
+                yield dict(zip(keys, row))
+            return
 
-        nodes_to_delete = [
-            node for _, node in self.cxdb.nodes.iterrows() 
-            if all(self._evaluate_condition(node['properties'], cond) for cond in conditions)
+        properties = nodes['properties'].to_numpy()
+        aliases = [alias for _, alias in return_items]
+        columns = [
+            self._iter_rows(nodes, None) if property_name is None
+            else map(dict.get, properties, itertools.repeat(property_name))
+            for property_name, _ in return_items
         ]
+        for row in zip(*columns):
+            yield dict(zip(aliases, row))
 
-        deleted_count = 0
-        for node in nodes_to_delete:
-            self.cxdb.delete_node(node['id'])
-            deleted_count += 1
+    def _execute_create(self, label, properties):
+        # add_node stores its own copy, so the cached plan's properties are never shared
+        node_id = self.cxdb.add_node(f"Node_{self.cxdb.next_node_id}", label, properties)
+        return node_id
 
-        return deleted_count
+    def _execute_delete(self, label, conditions):
+        nodes = self.cxdb.nodes
+        mask = self._conditions_mask(nodes, conditions, label)
+        node_ids = nodes.loc[mask, 'id'].tolist()
+        self.cxdb.delete_nodes(node_ids)
+        return len(node_ids)
 
     def _parse_where_clause(self, where_clause):
         conditions = []
-        for condition in where_clause.split('AND'):
-            match = re.match(r'n\.(\w+)\s*=\s*([\'"]?.+?[\'"]?)$', condition.strip())
-            if match:
-                property_name, property_value = match.groups()
-                conditions.append((property_name, property_value.strip("'\"")))
+        where_clause = where_clause.strip()
+        pos = 0
+        while pos < len(where_clause):
+            match = _CONDITION_RE.match(where_clause, pos)
+            if not match:
+                raise ValueError(f"Invalid condition in WHERE clause: {where_clause[pos:]}")
+            property_name, op, property_value = match.groups()
+            property_value = property_value.strip("'\"")
+            conditions.append((property_name, self._compile_condition(property_value, op)))
+            pos = match.end()
+        if not conditions:
+            raise ValueError(f"Invalid condition in WHERE clause: {where_clause}")
+        return tuple(conditions)
+
+    def _conditions_mask(self, nodes, conditions, label=None):
+        """
+        Evaluate the ANDed conditions over all nodes, or only those with the given label,
+        and return a boolean mask.
+
+        Conditions on the properties present on the fewest nodes run first, since at most
+        that many nodes can match; each later condition only compares the rows still in play.
+        """
+        columns = [(self.cxdb.node_property(name), predicate) for name, predicate in conditions]
+        columns.sort(key=lambda column: column[0].count())
+
+        if label is None:
+            positions = np.arange(len(nodes))
+        else:
+            positions = np.sort(nodes.index.get_indexer(self.cxdb.node_ids_by_type(label)))
+        for values, predicate in columns:
+            if len(positions) == 0:
+                break
+            if len(positions) < len(values):
+                values = values.iloc[positions]
+            positions = positions[predicate(values)]
+
+        mask = np.zeros(len(nodes), dtype=bool)
+        mask[positions] = True
+        return mask
+
+    def _compile_condition(self, text, op='='):
+        """
+        Build the predicate for one `n.prop <op> literal` condition. The literal's type and
+        the operator are resolved here, once per cached plan, so evaluation is a single typed
+        column compare.
+        """
+        if op == '<>':
+            equals = self._compile_condition(text)
+
+            def predicate(values):
+                return values.notna().to_numpy(dtype=bool) & ~equals(values)
+            return predicate
+
+        if op == 'CONTAINS':
+            return self._compile_contains(text)
+
+        value = self._coerce_value(text)
+
+        if op != '=':
+            return self._compile_ordering(_ORDERING_OPS[op], value)
+
+        if value is text:
+            def predicate(values):
+                return (values == value).fillna(False).to_numpy(dtype=bool)
+            return predicate
+
+        def predicate(values):
+            if is_numeric_dtype(values.dtype):
+                matches = values == value
+            elif isinstance(values.dtype, pd.StringDtype):
+                # String-valued properties compare against the literal text, e.g. '42' = 42
+                matches = values == text
             else:
-                raise ValueError(f"Invalid condition in WHERE clause: {condition}")
-        return conditions
-
-    def _evaluate_condition(self, properties, condition):
-        property_name, property_value = condition
-        node_value = properties.get(property_name)
-        if node_value is None:
-            return False
-        if isinstance(node_value, (int, float)):
-            try:
-                property_value = type(node_value)(property_value)
-            except ValueError:
-                return False
-        return str(node_value) == str(property_value)
+                matches = (values == value) | (values == text)
+            return matches.fillna(False).to_numpy(dtype=bool)
+        return predicate
+
+    def _compile_ordering(self, compare, value):
+        is_text = isinstance(value, str)
+
+        def predicate(values):
+            if is_numeric_dtype(values.dtype) or isinstance(values.dtype, pd.StringDtype):
+                if is_numeric_dtype(values.dtype) == is_text:
+                    return np.zeros(len(values), dtype=bool)
+                return compare(values, value).fillna(False).to_numpy(dtype=bool)
+            # Mixed-type column: only values of the literal's kind can match
+            return np.array([_compare_scalar(compare, item, value) for item in values.to_numpy()],
+                            dtype=bool)
+        return predicate
+
+    def _compile_contains(self, text):
+        def predicate(values):
+            if isinstance(values.dtype, pd.StringDtype):
+                return values.str.contains(text, regex=False).fillna(False).to_numpy(dtype=bool)
+            if is_numeric_dtype(values.dtype):
+                return np.zeros(len(values), dtype=bool)
+            # Mixed-type column: only string values can contain the literal
+            return np.array([isinstance(item, str) and text in item for item in values.to_numpy()],
+                            dtype=bool)
+        return predicate
+
+    def _coerce_value(self, value):
+        """
+        Convert a literal to int or float when it parses as one, otherwise return it unchanged.
+        Plain numbers take the regex fast path; the rarer spellings int() and float() also
+        accept (`1_000`, `inf`, `nan`, ...) are still converted.
+        """
+        if _INT_RE.fullmatch(value):
+            return int(value)
+        if _FLOAT_RE.fullmatch(value):
+            return float(value)
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
+            return value
 
     def _parse_properties(self, properties_str):
-        properties = {}
-        for prop in properties_str.split(','):
-            key, value = prop.split(':')
-            key = key.strip()
-            value = value.strip().strip("'\"")
-            try:
-                value = int(value)
-            except ValueError:
-                try:
-                    value = float(value)
-                except ValueError:
-                    pass
-            properties[key] = value
-        return properties
\ No newline at end of file
+        return dict(self._iter_properties(properties_str))
+
+    def _iter_properties(self, properties_str):
+        """
+        Yield (key, value) pairs from the body of a `{key: value, ...}` map in one pass.
+        Quoted values are kept as strings and may contain commas and colons.
+        """
+        pos = 0
+        end = len(properties_str)
+        find = properties_str.find
+        coerce_value = self._coerce_value
+        while pos < end:
+            colon = find(':', pos)
+            if colon < 0:
+                raise ValueError(f"Invalid property in CREATE query: {properties_str[pos:].strip()}")
+            key = properties_str[pos:colon].strip()
+
+            pos = colon + 1
+            while pos < end and properties_str[pos].isspace():
+                pos += 1
+
+            if pos < end and properties_str[pos] in '\'"':
+                quote = properties_str[pos]
+                close = find(quote, pos + 1)
+                if close < 0:
+                    raise ValueError(f"Unterminated string for property '{key}' in CREATE query")
+                value = properties_str[pos + 1:close]
+                comma = find(',', close + 1)
+                if comma < 0:
+                    comma = end
+                if properties_str[close + 1:comma].strip():
+                    raise ValueError(f"Invalid property in CREATE query: {properties_str[pos:comma].strip()}")
+            else:
+                comma = find(',', pos)
+                if comma < 0:
+                    comma = end
+                value = coerce_value(properties_str[pos:comma].strip())
+
+            yield key, value
+            pos = comma + 1
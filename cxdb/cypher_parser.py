@@ -1,19 +1,55 @@
 # cypher_parser.py
 
+import functools
+import sys
 import ply.yacc as yacc
 import logging
 from cxdb.cypher_lexer import CypherLexer
 from cxdb.cypher_exceptions import CypherSyntaxError, CypherSemanticError, CypherParserError, CypherLexerError
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class CypherParser:
-    def __init__(self):
-        self.lexer = CypherLexer()
-        self.lexer.build()
-        self.tokens = self.lexer.tokens
-        self.parser = yacc.yacc(module=self)
+# (lexer, parser) pair built on first use and shared by every CypherParser
+_SHARED = None
+
+def _shared_parser():
+    global _SHARED
+    if _SHARED is None:
+        lexer = CypherLexer()
+        lexer.build()
+        _SHARED = (lexer, _CypherGrammar().build_parser())
+    return _SHARED
+
+class _CypherGrammar:
+    """
+    Grammar rules for the shared LR parser. They live apart from CypherParser so the
+    parser's bound callables never keep a user's instance (and its parse cache) alive.
+    """
+    tokens = CypherLexer.tokens
+
+    def build_parser(self):
+        """
+        Construct the LR parser straight from the prebuilt tables in cxdb/parsetab.py,
+        skipping yacc's grammar validation and table generation. The tables are only used
+        when their signature matches the current p_* rules; otherwise yacc validates the
+        grammar and rewrites parsetab.py.
+        """
+        grammar = yacc.ParserReflect({name: getattr(self, name) for name in dir(self)},
+                                     log=yacc.NullLogger())
+        grammar.get_all()
+        try:
+            from cxdb import parsetab
+        except ImportError:
+            parsetab = None
+        if parsetab is not None and parsetab._lr_signature == grammar.signature():
+            table = yacc.LRTable()
+            table.read_table(parsetab)
+            table.bind_callables(grammar.pdict)
+            return yacc.LRParser(table, grammar.error_func)
+        # The unused-token warnings are expected for this grammar subset; grammar errors
+        # still raise YaccError
+        return yacc.yacc(module=self, tabmodule='cxdb.parsetab', debug=False, write_tables=True,
+                         errorlog=yacc.NullLogger())
 
     def p_query(self, p):
         '''query : match_clause where_clause return_clause'''
@@ -33,8 +69,8 @@ class CypherParser:
         p[0] = WhereClause(p[2]) if len(p) > 2 else None
 
     def p_condition(self, p):
-        '''condition : property_access EQUALS STRING'''
-        p[0] = Condition(p[1], p[3])
+        '''condition : property_access CMPOP STRING'''
+        p[0] = Condition(p[1], p[3], p[2])
 
     def p_property_access(self, p):
         '''property_access : IDENTIFIER DOT IDENTIFIER'''
@@ -45,18 +81,35 @@ class CypherParser:
         items = p[2]
         if not items:
             raise CypherSemanticError("RETURN clause must specify at least one return item")
-        p[0] = ReturnClause(items)
+        # Parsed ASTs are cached and shared between callers, so the items are frozen
+        p[0] = ReturnClause(tuple(items))
 
     def p_return_items(self, p):
-        '''return_items : IDENTIFIER
-                        | IDENTIFIER AS IDENTIFIER
-                        | IDENTIFIER COMMA return_items'''
+        '''return_items : return_item
+                        | return_items COMMA return_item'''
+        # Left recursive, so each item is appended in place with constant parser stack depth
         if len(p) == 2:
-            p[0] = [ReturnItem(p[1], p[1])]
-        elif len(p) == 4 and p[2] == 'AS':
-            p[0] = [ReturnItem(p[1], p[3])]
-        elif len(p) == 4 and p[2] == ',':
-            p[0] = [ReturnItem(p[1], p[1])] + p[3]
+            p[0] = [p[1]]
+        else:
+            p[0] = p[1]
+            p[0].append(p[3])
+
+    # One action per return_item alternative, so none of them branches on len(p)
+    def p_return_item(self, p):
+        '''return_item : IDENTIFIER'''
+        p[0] = ReturnItem(p[1])
+
+    def p_return_item_as(self, p):
+        '''return_item : IDENTIFIER AS IDENTIFIER'''
+        p[0] = ReturnItem(p[1], alias=p[3])
+
+    def p_return_item_property(self, p):
+        '''return_item : IDENTIFIER DOT IDENTIFIER'''
+        p[0] = ReturnItem(p[1], p[3])
+
+    def p_return_item_property_as(self, p):
+        '''return_item : IDENTIFIER DOT IDENTIFIER AS IDENTIFIER'''
+        p[0] = ReturnItem(p[1], p[3], p[5])
 
     def p_empty(self, p):
         'empty :'
@@ -68,30 +121,48 @@ class CypherParser:
         else:
             raise CypherSyntaxError("Syntax error at EOF", None, None, None)
 
+class CypherParser:
+    def __init__(self, parse_cache_size=1024):
+        self.lexer, self.parser = _shared_parser()
+        # ASTs keyed by query string, so repeated queries skip lexing and parsing.
+        # Failed parses raise and are not cached.
+        self._parse_cached = functools.lru_cache(maxsize=parse_cache_size)(self._parse_query)
+
     def parse(self, data):
+        """
+        Parse a query string into a Query AST.
+
+        Failures are logged and raised, never returned as None: lexer and syntax errors
+        raise their CypherParserError subclass, and any other failure (e.g. non-string
+        input) is logged with its traceback and raised as a CypherParserError. The module
+        only logs; configuring logging handlers is left to the application.
+        """
         try:
-            return self.parser.parse(data, lexer=self.lexer.lexer)
-        except CypherLexerError as e:
-            logger.error(f"Lexer error at position {e.position}: {e.message}")
-            print(f"Lexer error at position {e.position}: {e.message}")
-            print(f"Context:\n{self._get_error_context(data, e.position)}")
-        except CypherSyntaxError as e:
-            if e.line and e.column:
-                logger.error(f"Syntax error at line {e.line}, column {e.column}: {e.message}")
-                print(f"Syntax error at line {e.line}, column {e.column}: {e.message}")
-            else:
-                logger.error(f"Syntax error: {e.message}")
-                print(f"Syntax error: {e.message}")
-        except CypherSemanticError as e:
-            logger.error(f"Semantic error: {e.message}")
-            print(f"Semantic error: {e.message}")
+            return self._parse_cached(data)
         except CypherParserError as e:
-            logger.error(f"Parser error: {str(e)}")
-            print(f"Parser error: {str(e)}")
+            # Only build the message (and the context snippet) when it will be emitted
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(self._describe_error(data, e))
+            raise
         except Exception as e:
             logger.exception("Unexpected error occurred during parsing")
-            print(f"Unexpected error: {str(e)}")
-        return None
+            raise CypherParserError(f"Unexpected error: {e}") from e
+
+    def _describe_error(self, data, error):
+        if isinstance(error, CypherLexerError):
+            return (f"Lexer error at position {error.position}: {error.message}\n"
+                    f"Context:\n{self._get_error_context(data, error.position)}")
+        if isinstance(error, CypherSyntaxError):
+            if error.line and error.column:
+                return f"Syntax error at line {error.line}, column {error.column}: {error.message}"
+            return f"Syntax error: {error.message}"
+        if isinstance(error, CypherSemanticError):
+            return f"Semantic error: {error}"
+        return f"Parser error: {error}"
+
+    def _parse_query(self, data):
+        # The shared lexer carries per-input state, so each parse lexes with its own clone
+        return self.parser.parse(data, lexer=self.lexer.lexer.clone())
 
     def _get_error_context(self, data, position, context_length=20):
         start = max(0, position - context_length)
@@ -102,39 +173,75 @@ class CypherParser:
 
 # AST node classes
 class Query:
+    __slots__ = ('match', 'where', 'return_')
+
     def __init__(self, match, where, return_):
         self.match = match
         self.where = where
         self.return_ = return_
 
 class MatchClause:
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern):
         self.pattern = pattern
 
 class NodePattern:
+    __slots__ = ('identifier', 'label')
+
     def __init__(self, identifier, label):
         self.identifier = identifier
         self.label = label
 
 class WhereClause:
+    __slots__ = ('condition',)
+
     def __init__(self, condition):
         self.condition = condition
 
 class Condition:
-    def __init__(self, property_access, value):
+    __slots__ = ('property_access', 'value', 'operator')
+
+    def __init__(self, property_access, value, operator='='):
         self.property_access = property_access
         self.value = value
+        self.operator = operator
 
 class PropertyAccess:
+    __slots__ = ('identifier', 'property')
+
     def __init__(self, identifier, property):
         self.identifier = identifier
         self.property = property
         
 class ReturnClause:
+    __slots__ = ('items',)
+
     def __init__(self, items):
         self.items = items
 
 class ReturnItem:
-    def __init__(self, expression, alias):
-        self.expression = expression
-        self.alias = alias
\ No newline at end of file
+    """
+    A returned variable, or one of its properties, with an optional alias. The dotted
+    `expression` text is only formatted when first read.
+    """
+    __slots__ = ('identifier', 'property', '_alias', '_expression')
+
+    def __init__(self, identifier, property=None, alias=None):
+        self.identifier = identifier
+        self.property = property
+        self._alias = alias
+        self._expression = None
+
+    @property
+    def expression(self):
+        if self._expression is None:
+            if self.property is None:
+                self._expression = self.identifier
+            else:
+                self._expression = sys.intern(self.identifier + '.' + self.property)
+        return self._expression
+
+    @property
+    def alias(self):
+        return self.expression if self._alias is None else self._alias
\ No newline at end of file
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'AS', 'BY', 'CMPOP', 'COLON', 'COMMA', 'DOT', 'IDENTIFIER', 'LBRACE', 'LBRACKET', 'LIMIT', 'LPAREN', 'MATCH', 'NOT', 'NUMBER', 'OR', 'ORDER', 'RBRACE', 'RBRACKET', 'RELATIONSHIP_BOTH', 'RELATIONSHIP_LEFT', 'RELATIONSHIP_RIGHT', 'RETURN', 'RPAREN', 'SKIP', 'STRING', 'WHERE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_STRING>')|(?P<t_NUMBER>\\d+)|(?P<t_CMPOP><>|<=|>=|=|<(?!-)|>)|(?P<t_DOT>\\.)|(?P<t_LBRACE>\\{)|(?P<t_LBRACKET>\\[)|(?P<t_LPAREN>\\()|(?P<t_RBRACE>\\})|(?P<t_RBRACKET>\\])|(?P<t_RELATIONSHIP_BOTH>--)|(?P<t_RELATIONSHIP_LEFT><-)|(?P<t_RELATIONSHIP_RIGHT>->)|(?P<t_RPAREN>\\))|(?P<t_COLON>:)|(?P<t_COMMA>,)", [None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_STRING', 'STRING'), ('t_NUMBER', 'NUMBER'), (None, 'CMPOP'), (None, 'DOT'), (None, 'LBRACE'), (None, 'LBRACKET'), (None, 'LPAREN'), (None, 'RBRACE'), (None, 'RBRACKET'), (None, 'RELATIONSHIP_BOTH'), (None, 'RELATIONSHIP_LEFT'), (None, 'RELATIONSHIP_RIGHT'), (None, 'RPAREN'), (None, 'COLON'), (None, 'COMMA')])]}
+_lexstateignore = {'INITIAL': ' \t\n'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -2,10 +2,29 @@
 
 from ndex2.cx2 import CX2Network, RawCX2NetworkFactory
 import ndex2.client as nc2
+import functools
 import json
 import io
+import tempfile
 from .utils import load_config
 
+# Serialized CX2 uploads stay in memory up to this size and spill to a temporary file beyond it
+CX2_SPOOL_SIZE = 16 * 1024 * 1024
+
+def _cx2_stream(cx2):
+    """
+    Serialize CX2 JSON incrementally into a spooled binary stream positioned at the start,
+    so a large network is never held as one JSON string plus its encoded copy. Encoding
+    matches Ndex2.save_new_cx2_network, which serializes with ndex2's DecimalEncoder.
+    """
+    stream = tempfile.SpooledTemporaryFile(max_size=CX2_SPOOL_SIZE)
+    writer = io.TextIOWrapper(stream, encoding='utf-8')
+    json.dump(cx2, writer, cls=nc2.DecimalEncoder)
+    writer.flush()
+    writer.detach()
+    stream.seek(0)
+    return stream
+
 class NDExConnector:
     def __init__(self, cxdb, config_path='~/cxdb/config.ini'):
         self.cxdb = cxdb
@@ -16,9 +35,14 @@ class NDExConnector:
         self.server = load_config('NDEX', 'server', fallback='http://public.ndexbio.org', config_path=config_path)
         self.username = load_config('NDEX', 'username', config_path=config_path)
         self.password = load_config('NDEX', 'password', config_path=config_path)
-        
-        # Create NDEx client
-        self.ndex = nc2.Ndex2(self.server, self.username, self.password)
+
+    @functools.cached_property
+    def ndex(self):
+        """
+        NDEx client owned by this connector. It is created on first use, so local CX2
+        conversions never pay for the server version check.
+        """
+        return nc2.Ndex2(self.server, self.username, self.password)
 
     def to_cx2(self):
         if self.cx2_network is None:
@@ -26,23 +50,29 @@ class NDExConnector:
         else:
             self.clear_cx2()
 
-        # Add nodes from CXDB to CX2Network
-        for _, node in self.cxdb.nodes.iterrows():
+        # Add nodes from CXDB to CX2Network, reading whole columns rather than boxing each row
+        nodes = self.cxdb.nodes
+        add_node = self.cx2_network.add_node
+        for node_id, name, node_type, properties in zip(nodes['id'].tolist(), nodes['name'].tolist(),
+                                                        nodes['type'].tolist(), nodes['properties'].tolist()):
             node_attrs = {
-                'name': node['name'],
-                'type': node['type']
+                'name': name,
+                'type': node_type
             }
-            node_attrs.update(node['properties'])
-            self.cx2_network.add_node(int(node['id']), node_attrs)
+            node_attrs.update(properties)
+            add_node(node_id, node_attrs)
 
         # Add edges from CXDB to CX2Network
-        for _, edge in self.cxdb.edges.iterrows():
+        edges = self.cxdb.edges
+        add_edge = self.cx2_network.add_edge
+        for source_id, target_id, relationship, properties in zip(
+                edges['source_id'].tolist(), edges['target_id'].tolist(),
+                edges['relationship'].tolist(), edges['properties'].tolist()):
             edge_attrs = {
-                'interaction': edge['relationship']
+                'interaction': relationship
             }
-            edge_attrs.update(edge['properties'])
-            edge_id = self.cx2_network.add_edge(source=int(edge['source_id']), target=int(edge['target_id']))
-            self.cx2_network.update_edge(edge_id, edge_attrs)
+            edge_attrs.update(properties)
+            add_edge(source=source_id, target=target_id, attributes=edge_attrs)
 
         return self.cx2_network
 
@@ -53,14 +83,14 @@ class NDExConnector:
         if description is not None:
             cx2_network.add_network_attribute('description', description)
         
-        if self.ndex_uuid:
-            # Update existing network
-            cx_stream = io.BytesIO(json.dumps(cx2_network.to_cx2()).encode('utf-8'))
-            self.ndex.update_cx2_network(cx_stream, self.ndex_uuid)
-        else:
-            # Create new network
-            url = self.ndex.save_new_cx2_network(cx2_network.to_cx2())
-            self.ndex_uuid = url.split("/")[-1]
+        with _cx2_stream(cx2_network.to_cx2()) as cx_stream:
+            if self.ndex_uuid:
+                # Update existing network
+                self.ndex.update_cx2_network(cx_stream, self.ndex_uuid)
+            else:
+                # Create new network
+                url = self.ndex.save_cx2_stream_as_new_network(cx_stream)
+                self.ndex_uuid = url.split("/")[-1]
 
 
         # # Set visibility
@@ -91,25 +121,33 @@ class NDExConnector:
         self.cx2_network = cx2_network
 
         # Import nodes
+        node_records = []
         for node_id, node_data in cx2_network.get_nodes().items():
             node_attrs = node_data['v']
             name = node_attrs.pop('name', f"Node_{node_id}")
             node_type = node_attrs.pop('type', 'Default')
-            self.cxdb.add_node(name, node_type, node_attrs)
+            node_records.append({'name': name, 'type': node_type, 'properties': node_attrs})
+        self.cxdb.add_nodes(node_records)
 
         # Import edges
+        edge_records = []
         for edge_id, edge_data in cx2_network.get_edges().items():
             edge = cx2_network.get_edge(edge_id)
-            source_id = edge['s']
-            target_id = edge['t']
             relationship = edge_data['v'].pop('interaction', 'interacts_with')
-            self.cxdb.add_edge(source_id, target_id, relationship, edge_data['v'])
+            edge_records.append({'source_id': edge['s'], 'target_id': edge['t'],
+                                 'relationship': relationship, 'properties': edge_data['v']})
+        self.cxdb.add_edges(edge_records)
 
         return self.cxdb
 
     def clear_cx2(self):
+        # Nodes and edges are removed in place so the network attributes and styles survive.
+        # Edges go first: remove_node scans every remaining edge for dangling ones, which is
+        # then a no-op instead of making the node loop O(nodes * edges).
         if self.cx2_network:
-            for node_id in list(self.cx2_network.get_nodes()):
-                self.cx2_network.remove_node(node_id)
+            remove_edge = self.cx2_network.remove_edge
             for edge_id in list(self.cx2_network.get_edges()):
-                self.cx2_network.remove_edge(edge_id)
\ No newline at end of file
+                remove_edge(edge_id)
+            remove_node = self.cx2_network.remove_node
+            for node_id in list(self.cx2_network.get_nodes()):
+                remove_node(node_id)
\ No newline at end of file
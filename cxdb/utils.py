@@ -1,6 +1,7 @@
 # cxdb/utils.py
 
 import configparser
+import functools
 import os
 
 def load_config(section, key, fallback=None, config_path='~/cxdb/config.ini'):
@@ -16,28 +17,42 @@ def load_config(section, key, fallback=None, config_path='~/cxdb/config.ini'):
     Returns:
     The value from the config file, or the fallback value if not found.
     """
-    config = configparser.ConfigParser()
     expanded_config_file_path = os.path.expanduser(config_path)
     
     # Check if the config file exists
-    if not os.path.exists(expanded_config_file_path):
-        raise FileNotFoundError(f"Config file not found at {expanded_config_file_path}")
+    try:
+        stat = os.stat(expanded_config_file_path)
+    except OSError:
+        raise FileNotFoundError(f"Config file not found at {expanded_config_file_path}") from None
     
-    # Read the configuration file
-    config.read(expanded_config_file_path)
+    # Parsed once per file version; a changed file has a new mtime/size and is re-read
+    values = _read_config(expanded_config_file_path, stat.st_mtime_ns, stat.st_size)
     
     # Make section and key case-insensitive
     section = section.lower()
     key = key.lower()
     
     # Access the config value
-    for config_section in config.sections():
-        if config_section.lower() == section:
-            for config_key, value in config[config_section].items():
-                if config_key.lower() == key:
-                    return value
+    value = values.get(section, {}).get(key)
+    if value is not None:
+        return value
     
     if fallback is not None:
         return fallback
     
-    raise ValueError(f"Key '{key}' not found in section '{section}' of the config file")
\ No newline at end of file
+    raise ValueError(f"Key '{key}' not found in section '{section}' of the config file")
+
+@functools.lru_cache(maxsize=16)
+def _read_config(path, mtime_ns, size):
+    """
+    Parse a config file into {section: {key: value}} with lower-cased sections and keys.
+    The first occurrence wins when sections or keys differ only by case.
+    """
+    config = configparser.ConfigParser()
+    config.read(path)
+    values = {}
+    for config_section in config.sections():
+        section_values = values.setdefault(config_section.lower(), {})
+        for config_key, value in config[config_section].items():
+            section_values.setdefault(config_key.lower(), value)
+    return values
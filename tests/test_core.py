@@ -1,6 +1,7 @@
 # test_core.py
 
 import pytest
+import pandas as pd
 from cxdb.core import CXDB
 
 def test_cxdb_initialization():
@@ -141,4 +142,201 @@ def test_delete_nonexistent_edge():
     node1_id = db.add_node("Node1", "TestType")
     node2_id = db.add_node("Node2", "TestType")
     with pytest.raises(ValueError, match="Edge not found"):
-        db.delete_edge(node1_id, node2_id, "NonexistentRelation")
\ No newline at end of file
+        db.delete_edge(node1_id, node2_id, "NonexistentRelation")
+
+def test_nodes_view_refreshes_after_mutation():
+    db = CXDB()
+    db.add_node("Node1", "TestType")
+    assert len(db.nodes) == 1
+    db.add_node("Node2", "TestType")
+    assert len(db.nodes) == 2
+    db.delete_node(1)
+    assert list(db.nodes['name']) == ["Node2"]
+
+def test_delete_node_removes_incident_edges_only():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType")
+    node2_id = db.add_node("Node2", "TestType")
+    node3_id = db.add_node("Node3", "TestType")
+    db.add_edge(node1_id, node2_id, "TestRelation")
+    db.add_edge(node3_id, node1_id, "TestRelation")
+    db.add_edge(node2_id, node3_id, "TestRelation")
+    db.delete_node(node1_id)
+    assert len(db.edges) == 1
+    assert db.get_edge(node2_id, node3_id, "TestRelation") is not None
+    assert db.get_edge(node3_id, node1_id, "TestRelation") is None
+
+def test_get_node_by_name():
+    db = CXDB()
+    node_id = db.add_node("Node1", "TestType", {"key": "value"})
+    assert db.get_node_by_name("Node1")['id'] == node_id
+    db.update_node(node_id, name="Renamed")
+    assert db.get_node_by_name("Node1") is None
+    assert db.get_node_by_name("Renamed")['id'] == node_id
+
+def test_add_nodes_and_edges():
+    db = CXDB()
+    node_ids = db.add_nodes([
+        {"name": "Node1", "type": "TestType", "properties": {"key": "value"}},
+        {"name": "Node2", "type": "TestType"},
+    ])
+    assert node_ids == [1, 2]
+    assert db.next_node_id == 3
+    assert db.get_node(2)['properties'] == {}
+    db.add_edges([{"source_id": 1, "target_id": 2, "relationship": "TestRelation"}])
+    assert db.get_edge(1, 2, "TestRelation")['properties'] == {}
+    assert len(db.nodes) == 2
+    assert len(db.edges) == 1
+
+def test_add_nodes_duplicate_name():
+    db = CXDB()
+    db.add_node("Node1", "TestType")
+    with pytest.raises(ValueError, match="Node name must be unique"):
+        db.add_nodes([{"name": "Node2", "type": "TestType"}, {"name": "Node1", "type": "TestType"}])
+    assert len(db.nodes) == 1
+
+def test_edges_view_after_replacing_edge():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType")
+    node2_id = db.add_node("Node2", "TestType")
+    db.add_edge(node1_id, node2_id, "TestRelation", {"key": "old"})
+    assert len(db.edges) == 1
+    db.add_edge(node1_id, node2_id, "TestRelation", {"key": "new"})
+    db.add_edge(node2_id, node1_id, "TestRelation")
+    assert len(db.edges) == 2
+    assert db.edges.iloc[0]['properties'] == {"key": "new"}
+
+def test_add_edge_replaces_same_key():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType")
+    node2_id = db.add_node("Node2", "TestType")
+    db.add_edge(node1_id, node2_id, "TestRelation", {"key": "old"})
+    db.add_edge(node1_id, node2_id, "TestRelation", {"key": "new"})
+    assert db.get_edge(node1_id, node2_id, "TestRelation")['properties'] == {"key": "new"}
+    db.delete_edge(node1_id, node2_id, "TestRelation")
+    assert db.get_edge(node1_id, node2_id, "TestRelation") is None
+    assert len(db.edges) == 0
+
+def test_edge_properties_not_shared():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType")
+    node2_id = db.add_node("Node2", "TestType")
+    properties = {"key": "value"}
+    db.add_edge(node1_id, node2_id, "TestRelation", properties)
+    properties["key"] = "changed"
+    db.get_edge(node1_id, node2_id, "TestRelation")['properties']["key"] = "changed"
+    assert db.get_edge(node1_id, node2_id, "TestRelation")['properties'] == {"key": "value"}
+    assert db.edges.iloc[0]['properties'] == {"key": "value"}
+
+def test_view_dtypes():
+    db = CXDB()
+    assert db.nodes['id'].dtype == 'int64'
+    node1_id = db.add_node("Node1", "TestType")
+    db.nodes
+    node2_id = db.add_node("Node2", "OtherType")
+    db.add_edge(node1_id, node2_id, "TestRelation")
+    assert db.nodes['id'].dtype == 'int64'
+    assert db.nodes['type'].dtype == 'category'
+    assert list(db.nodes['type']) == ["TestType", "OtherType"]
+    assert db.edges['source_id'].dtype == 'int64'
+    assert db.edges['relationship'].dtype == 'category'
+
+def test_delete_nodes():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType")
+    node2_id = db.add_node("Node2", "TestType")
+    node3_id = db.add_node("Node3", "TestType")
+    db.add_edge(node1_id, node2_id, "TestRelation")
+    db.add_edge(node2_id, node3_id, "TestRelation")
+    db.add_edge(node3_id, node3_id, "TestRelation")
+    assert len(db.nodes) == 3 and len(db.edges) == 3
+    db.delete_nodes([node1_id, node3_id])
+    assert list(db.nodes['name']) == ["Node2"]
+    assert db.edges.empty
+    assert set(db.node_names) == {"Node2"}
+
+def test_delete_nodes_nonexistent():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType")
+    with pytest.raises(ValueError, match="Node not found"):
+        db.delete_nodes([node1_id, 999])
+    assert db.get_node(node1_id) is not None
+
+def test_node_property_column():
+    db = CXDB()
+    db.add_node("Node1", "TestType", {"age": 30})
+    db.add_node("Node2", "TestType", {"city": "Boston"})
+    ages = db.node_property("age")
+    assert ages.dtype == 'Int64'
+    assert ages.iloc[0] == 30 and ages.isna().iloc[1]
+    assert db.node_property("age") is ages
+    db.add_node("Node3", "TestType", {"age": 40})
+    assert list(db.node_property("age").fillna(0)) == [30, 0, 40]
+
+def test_views_indexed_by_key():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType")
+    db.nodes
+    node2_id = db.add_node("Node2", "TestType")
+    db.add_edge(node1_id, node2_id, "TestRelation")
+    assert db.nodes.loc[node2_id, 'name'] == "Node2"
+    assert db.edges.loc[(node1_id, node2_id, "TestRelation"), 'target_id'] == node2_id
+    db.delete_node(node1_id)
+    assert list(db.nodes.index) == [node2_id]
+
+def test_node_ids_by_type():
+    db = CXDB()
+    node1 = db.add_node("Node1", "Person")
+    node2 = db.add_node("Node2", "Robot")
+    node3, = db.add_nodes([{'name': "Node3", 'type': "Person"}])
+    assert sorted(db.node_ids_by_type("Person")) == [node1, node3]
+    db.update_node(node2, type="Person")
+    db.delete_node(node1)
+    assert sorted(db.node_ids_by_type("Person")) == [node2, node3]
+    assert db.node_ids_by_type("Robot") == []
+
+def test_node_property_column_maintained():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType", {"age": 30})
+    db.add_node("Node2", "TestType", {"age": 25})
+    db.node_property("age")
+    db.add_nodes([{'name': "Node3", 'type': "TestType"}, {'name': "Node4", 'type': "TestType", 'properties': {"age": 40}}])
+    ages = db.node_property("age")
+    assert ages.dtype == 'Int64'
+    assert list(ages.fillna(0)) == [30, 25, 0, 40]
+    db.delete_node(node1_id)
+    assert list(db.node_property("age").index) == list(db.nodes.index)
+    db.add_node("Node5", "TestType", {"age": "unknown"})
+    assert list(db.node_property("age").fillna(0)) == [25, 0, 40, "unknown"]
+
+def test_node_property_column_after_emptied():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TestType", {"age": 30})
+    db.node_property("age")
+    db.delete_node(node1_id)
+    db.add_node("Node2", "TestType", {"age": 40})
+    assert list(db.node_property("age")) == [40]
+
+def test_package_dir_lists_names_once():
+    import cxdb
+    assert cxdb.CXDB is CXDB
+    assert dir(cxdb).count('CXDB') == 1
+    assert 'NDExConnector' in dir(cxdb)
+
+def test_appended_views_match_rebuild():
+    db = CXDB()
+    node1_id = db.add_node("Node1", "TypeB")
+    db.add_edge(node1_id, node1_id, "RelB")
+    nodes, edges = db.nodes, db.edges
+    node2_id = db.add_node("Node2", "TypeA")
+    db.add_node("Node3", "TypeB")
+    db.add_edge(node1_id, node2_id, "RelA")
+    appended_nodes, appended_edges = db.nodes, db.edges
+    # Appending leaves earlier views untouched
+    assert list(nodes['type'].cat.categories) == ["TypeB"]
+    db._invalidate_nodes()
+    db._invalidate_edges()
+    pd.testing.assert_frame_equal(appended_nodes, db.nodes, check_categorical=False)
+    pd.testing.assert_frame_equal(appended_edges, db.edges, check_categorical=False)
+    assert appended_nodes['type'].dtype == 'category'
+    assert appended_edges['relationship'].dtype == 'category'
@@ -98,4 +98,114 @@ def test_match_node_with_int(cypher_executor):
     cypher_executor.execute("CREATE (n:Person {name: 'John', age: 30})")
     result = cypher_executor.execute("MATCH (n) WHERE n.age = 30 RETURN n")
     assert len(result) == 1
-    assert result[0]['properties'] == {'name': 'John', 'age': 30}
\ No newline at end of file
+    assert result[0]['properties'] == {'name': 'John', 'age': 30}
+
+def test_repeated_query_reuses_plan(cypher_executor):
+    first = cypher_executor.execute("CREATE (n:Person {name: 'John', age: 30})")
+    second = cypher_executor.execute("CREATE (n:Person {name: 'John', age: 30})")
+    assert cypher_executor._compile.cache_info().hits == 1
+    cypher_executor.cxdb.update_node(first, properties={'age': 31})
+    assert cypher_executor.cxdb.get_node(second)['properties'] == {'name': 'John', 'age': 30}
+
+def test_match_with_and_inside_string(cypher_executor):
+    cypher_executor.execute("CREATE (n:Company {name: 'Johnson AND Johnson'})")
+    result = cypher_executor.execute("MATCH (n) WHERE n.name = 'Johnson AND Johnson' RETURN n")
+    assert len(result) == 1
+
+def test_match_numeric_literal_against_string_property(cypher_executor):
+    cypher_executor.cxdb.add_node("John", "Person", {'code': '42'})
+    cypher_executor.execute("CREATE (n:Person {name: 'Jane', height: 1.85})")
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.code = 42 RETURN n")) == 1
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.height = 1.85 RETURN n")) == 1
+
+def test_create_node_with_quoted_comma_and_colon(cypher_executor):
+    result = cypher_executor.execute("CREATE (n:Person {name: 'Smith, John', url: 'http://example.org', age: 30})")
+    node = cypher_executor.cxdb.get_node(result)
+    assert node['properties'] == {'name': 'Smith, John', 'url': 'http://example.org', 'age': 30}
+
+def test_match_conditions_on_sparse_property(cypher_executor):
+    cypher_executor.execute("CREATE (n:Person {name: 'John', age: 30})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jane', age: 30, nickname: 'JJ'})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jim', age: 25, nickname: 'JJ'})")
+    result = cypher_executor.execute("MATCH (n) WHERE n.age = 30 AND n.nickname = 'JJ' RETURN n")
+    assert [node['properties']['name'] for node in result] == ['Jane']
+    assert cypher_executor.execute("MATCH (n) WHERE n.nickname = 'XX' AND n.age = 30 RETURN n") == []
+
+def test_match_numeric_literal_in_mixed_column(cypher_executor):
+    cypher_executor.cxdb.add_node("John", "Person", {'code': 42})
+    cypher_executor.cxdb.add_node("Jane", "Person", {'code': 'X1'})
+    cypher_executor.cxdb.add_node("Jim", "Person", {'code': '42'})
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.code = 42 RETURN n")) == 2
+
+def test_numeric_literal_spellings(cypher_executor):
+    node_id = cypher_executor.execute("CREATE (n:Person {name: 'John', count: 1_000, limit: inf})")
+    assert cypher_executor.cxdb.get_node(node_id)['properties'] == {'name': 'John', 'count': 1000,
+                                                                     'limit': float('inf')}
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.count = 1_000 RETURN n")) == 1
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.limit = inf RETURN n")) == 1
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.count < inf RETURN n")) == 1
+
+def test_match_return_properties(cypher_executor):
+    cypher_executor.execute("CREATE (n:Person {name: 'John', age: 30})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jane', age: 30})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jim', age: 25})")
+    result = cypher_executor.execute("MATCH (n) WHERE n.age = 30 RETURN n.name, n.age AS years")
+    assert result == [{'n.name': 'John', 'years': 30}, {'n.name': 'Jane', 'years': 30}]
+
+def test_invalid_return_item(cypher_executor):
+    with pytest.raises(ValueError, match="Invalid item in RETURN clause"):
+        cypher_executor.execute("MATCH (n) WHERE n.age = 30 RETURN m.name")
+    # Return items follow the same casing as WHERE conditions: lower-case `n`, upper-case AS
+    with pytest.raises(ValueError, match="Invalid item in RETURN clause"):
+        cypher_executor.execute("MATCH (n) WHERE n.age = 30 RETURN N.name")
+
+def test_match_and_delete_by_label(cypher_executor):
+    cypher_executor.execute("CREATE (n:Person {name: 'John', age: 30})")
+    cypher_executor.execute("CREATE (n:Robot {name: 'R2', age: 30})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jane', age: 30})")
+    result = cypher_executor.execute("MATCH (n:Person) WHERE n.age = 30 RETURN n.name")
+    assert result == [{'n.name': 'John'}, {'n.name': 'Jane'}]
+    assert cypher_executor.execute("MATCH (n:Alien) WHERE n.age = 30 RETURN n") == []
+    assert cypher_executor.execute("DELETE (n:Robot) WHERE n.age = 30") == 1
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.age = 30 RETURN n")) == 2
+
+def test_comparison_operators(cypher_executor):
+    cypher_executor.execute("CREATE (n:Person {name: 'John', age: 30})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jane', age: 25})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jim', age: 'unknown'})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Joe'})")
+
+    def names(where):
+        return [row['n.name'] for row in cypher_executor.execute(f"MATCH (n) WHERE {where} RETURN n.name")]
+
+    assert names("n.age > 26") == ['John']
+    assert names("n.age <= 30") == ['John', 'Jane']
+    assert names("n.age >= 25 AND n.age < 30") == ['Jane']
+    assert names("n.age <> 30") == ['Jane', 'Jim']
+    assert names("n.name > 'Ji'") == ['John', 'Jim', 'Joe']
+
+def test_match_streams_rows(cypher_executor):
+    cypher_executor.execute("CREATE (n:Person {name: 'John', age: 30})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jane', age: 30})")
+    rows = cypher_executor.execute("MATCH (n) WHERE n.age = 30 RETURN n, n.name AS name", materialize=False)
+    first = next(rows)
+    assert first['name'] == 'John' and first['n']['properties'] == {'name': 'John', 'age': 30}
+    assert [row['name'] for row in rows] == ['Jane']
+
+def test_contains_condition(cypher_executor):
+    cypher_executor.execute("CREATE (n:Person {name: 'John Smith', age: 30})")
+    cypher_executor.execute("CREATE (n:Person {name: 'Jane Doe', age: 30})")
+    cypher_executor.execute("CREATE (n:Person {name: 42, age: 25})")
+    result = cypher_executor.execute("MATCH (n) WHERE n.name CONTAINS 'Smi' AND n.age = 30 RETURN n.name")
+    assert result == [{'n.name': 'John Smith'}]
+    assert cypher_executor.execute("MATCH (n) WHERE n.age CONTAINS '3' RETURN n") == []
+
+def test_mutating_results_does_not_change_matches(cypher_executor, cxdb):
+    properties = {'age': 1}
+    cxdb.add_node('a', 'P', properties)
+    properties['age'] = 3
+    result = cypher_executor.execute("MATCH (n) WHERE n.age = 1 RETURN n")
+    result[0]['properties']['age'] = 2
+    cxdb.get_node(1)['properties']['age'] = 2
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.age = 2 RETURN n")) == 0
+    assert len(cypher_executor.execute("MATCH (n) WHERE n.age = 1 RETURN n")) == 1
@@ -1,8 +1,11 @@
 # tests/test_cypher_parser.py
 
+import gc
+import weakref
 import pytest
-from cxdb.cypher_parser import CypherParser, Query, MatchClause, WhereClause, ReturnClause
-from cxdb.cypher_exceptions import CypherLexerError, CypherSyntaxError, CypherSemanticError
+from cxdb import cypher_parser
+from cxdb.cypher_parser import CypherParser, Query, MatchClause, WhereClause, Condition, PropertyAccess, ReturnClause
+from cxdb.cypher_exceptions import CypherParserError, CypherLexerError, CypherSyntaxError
 
 @pytest.fixture
 def parser():
@@ -47,7 +50,73 @@ def test_syntax_error(parser):
     with pytest.raises(CypherSyntaxError):
         parser.parse(query)
 
-def test_semantic_error(parser):
-    query = "MATCH (n:Person) RETURN"
-    with pytest.raises(CypherSemanticError):
-        parser.parse(query)
\ No newline at end of file
+def test_unexpected_error(parser):
+    with pytest.raises(CypherParserError):
+        parser.parse(123)
+
+def test_parse_cache(parser):
+    query = "MATCH (n:Person) RETURN n"
+    assert parser.parse(query) is parser.parse(query)
+    assert parser.parse("MATCH (n:Movie) RETURN n").match.pattern.label == 'Movie'
+
+def test_multiple_return_items(parser):
+    ast = parser.parse("MATCH (n:Person) RETURN n, m AS friend, k")
+    assert [(item.expression, item.alias) for item in ast.return_.items] == [
+        ('n', 'n'), ('m', 'friend'), ('k', 'k')]
+
+def test_identifiers_interned(parser):
+    first = parser.parse("MATCH (n:" + "Per" + "son) RETURN n")
+    second = parser.parse("MATCH (m:Person) RETURN m")
+    assert first.match.pattern.label is second.match.pattern.label
+
+def test_parser_tables_shared(parser):
+    other = CypherParser()
+    assert other.parser is parser.parser
+    assert other.parse("MATCH (n:Person) RETURN n").match.pattern.label == 'Person'
+
+def test_shared_tables_do_not_keep_parsers_alive(monkeypatch):
+    # Make this parser the one that builds the shared tables
+    monkeypatch.setattr(cypher_parser, '_SHARED', None)
+    first = CypherParser()
+    first.parse("MATCH (n:Person) RETURN n")
+    ref = weakref.ref(first)
+    del first
+    gc.collect()
+    assert ref() is None
+    assert CypherParser().parse("MATCH (n:Person) RETURN n").match.pattern.label == 'Person'
+
+def test_comparison_operator(parser):
+    ast = parser.parse("MATCH (n:Person) WHERE n.name >= 'J' RETURN n")
+    assert ast.where.condition.operator == '>='
+    assert ast.where.condition.value == 'J'
+
+def test_keywords_case_insensitive(parser):
+    ast = parser.parse("match (n:Person) Where n.name = 'John' return n")
+    assert ast.match.pattern.label == 'Person'
+    assert ast.where.condition.value == 'John'
+
+def test_return_item_fields(parser):
+    item = parser.parse("MATCH (n:Person) RETURN n.name").return_.items[0]
+    assert (item.identifier, item.property) == ('n', 'name')
+    assert item.expression == item.alias == 'n.name'
+
+def test_cached_ast_items_frozen(parser):
+    query = "MATCH (n:Person) RETURN n, m"
+    ast = parser.parse(query)
+    with pytest.raises(AttributeError):
+        ast.return_.items.append(ast.return_.items[0])
+    assert len(parser.parse(query).return_.items) == 2
+
+def test_stale_parser_tables_rebuilt(monkeypatch):
+    from cxdb import parsetab
+    build = cypher_parser.yacc.yacc
+    calls = []
+    def rebuild(**kwargs):
+        calls.append(kwargs)
+        return build(**dict(kwargs, write_tables=False))
+    monkeypatch.setattr(parsetab, '_lr_signature', 'stale')
+    monkeypatch.setattr(cypher_parser.yacc, 'yacc', rebuild)
+    monkeypatch.setattr(cypher_parser, '_SHARED', None)
+    ast = CypherParser().parse("MATCH (n:Person) WHERE n.name = 'Alice' RETURN n.name AS name")
+    assert len(calls) == 1
+    assert ast.return_.items[0].alias == 'name'
@@ -66,4 +66,10 @@ def test_load_config_case_insensitive_key(temp_config_file):
 
 def test_load_config_mixed_case(temp_config_file):
     value = load_config('mixedcasesection', 'mixedcasekey', config_path=temp_config_file)
-    assert value == 'mixed_case_value'
\ No newline at end of file
+    assert value == 'mixed_case_value'
+
+def test_load_config_reread_after_change(temp_config_file):
+    assert load_config('TestSection', 'test_key', config_path=temp_config_file) == 'test_value'
+    with open(temp_config_file, 'w') as config_file:
+        config_file.write("[TestSection]\ntest_key = changed_value\n")
+    assert load_config('TestSection', 'test_key', config_path=temp_config_file) == 'changed_value'
@@ -0,0 +1,98 @@
+# tests/test_ndex.py
+
+import decimal
+import json
+import pytest
+from unittest import mock
+from cxdb.core import CXDB
+from cxdb import ndex
+from cxdb.ndex import NDExConnector
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / 'config.ini'
+    path.write_text("""
+[NDEX]
+server = http://ndex.example.org
+username = test_user
+password = test_password
+""")
+    return str(path)
+
+@pytest.fixture
+def ndex_client(monkeypatch):
+    client_class = mock.MagicMock()
+    monkeypatch.setattr(ndex.nc2, 'Ndex2', client_class)
+    return client_class
+
+@pytest.fixture
+def cxdb():
+    db = CXDB()
+    db.add_node("Node1", "Type1", {"prop1": "value1"})
+    db.add_node("Node2", "Type2", {"prop2": "value2"})
+    db.add_edge(1, 2, "Relation1", {"edge_prop": "edge_value"})
+    return db
+
+def test_client_per_connector(cxdb, config_path, ndex_client):
+    first = NDExConnector(cxdb, config_path=config_path)
+    second = NDExConnector(cxdb, config_path=config_path)
+    ndex_client.assert_not_called()
+    assert first.ndex is first.ndex
+    ndex_client.assert_called_once_with('http://ndex.example.org', 'test_user', 'test_password')
+    ndex_client.side_effect = lambda *args: mock.MagicMock()
+    assert second.ndex is not first.ndex
+
+def test_to_ndex_uploads_cx2(cxdb, config_path, ndex_client):
+    connector = NDExConnector(cxdb, config_path=config_path)
+    cxdb.add_node("Node3", "Type3", {"weight": 0.5})
+    uploads = []
+    def save(cx_stream):
+        uploads.append(json.load(cx_stream))
+        return 'http://ndex.example.org/v3/networks/abc-123'
+    client = ndex_client.return_value
+    client.save_cx2_stream_as_new_network.side_effect = save
+    client.update_cx2_network.side_effect = lambda cx_stream, uuid: uploads.append(json.load(cx_stream))
+
+    assert connector.to_ndex("Test Network") == 'abc-123'
+    assert connector.to_ndex() == 'abc-123'
+    client.update_cx2_network.assert_called_once()
+    assert uploads[1] == connector.cx2_network.to_cx2()
+    aspects = {name: values for aspect in uploads[0] for name, values in aspect.items()}
+    assert aspects['networkAttributes'] == [{'name': 'Test Network'}]
+    assert len(aspects['nodes']) == 3
+    assert aspects['nodes'][2]['v']['weight'] == 0.5
+    assert aspects['edges'][0]['v'] == {'interaction': 'Relation1', 'edge_prop': 'edge_value'}
+
+def test_cx2_stream_uses_ndex_encoder():
+    with ndex._cx2_stream([{'nodes': [{'id': 1, 'v': {'weight': decimal.Decimal('0.5')}}]}]) as stream:
+        assert json.load(stream) == [{'nodes': [{'id': 1, 'v': {'weight': 0.5}}]}]
+
+def test_cx2_round_trip(cxdb, config_path, ndex_client):
+    cx2_network = NDExConnector(cxdb, config_path=config_path).to_cx2()
+    assert cx2_network.get_node(1)['v'] == {'name': 'Node1', 'type': 'Type1', 'prop1': 'value1'}
+
+    db = CXDB()
+    NDExConnector(db, config_path=config_path).from_cx2(cx2_network)
+    assert len(db.nodes) == 2
+    assert len(db.edges) == 1
+    source = db.get_node_by_name("Node1")
+    target = db.get_node_by_name("Node2")
+    assert target['type'] == "Type2"
+    assert target['properties'] == {"prop2": "value2"}
+    edge = db.get_edge(source['id'], target['id'], "Relation1")
+    assert edge['properties'] == {"edge_prop": "edge_value"}
+    ndex_client.assert_not_called()
+
+def test_clear_cx2_removes_edges_first(cxdb, config_path, ndex_client):
+    connector = NDExConnector(cxdb, config_path=config_path)
+    cx2_network = connector.to_cx2()
+    cx2_network.add_network_attribute('name', 'Kept')
+    calls = []
+    remove_node, remove_edge = cx2_network.remove_node, cx2_network.remove_edge
+    cx2_network.remove_node = lambda node_id: (calls.append('node'), remove_node(node_id))
+    cx2_network.remove_edge = lambda edge_id: (calls.append('edge'), remove_edge(edge_id))
+
+    connector.clear_cx2()
+    assert calls == ['edge', 'node', 'node']
+    assert not cx2_network.get_nodes() and not cx2_network.get_edges()
+    assert cx2_network.get_network_attributes() == {'name': 'Kept'}
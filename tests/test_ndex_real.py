@@ -9,6 +9,10 @@ import ndex2.client as nc2
 
 TEST_CONFIG_PATH = os.path.expanduser('~/cxdb/test_config.ini')
 
+# These tests talk to a real NDEx server; tests/test_ndex.py covers the connector offline
+pytestmark = pytest.mark.skipif(not os.path.exists(TEST_CONFIG_PATH),
+                                reason=f"NDEx test config not found at {TEST_CONFIG_PATH}")
+
 @pytest.fixture
 def cxdb():
     db = CXDB()